@@ -1,14 +1,18 @@
 # backward_bending_supply.py
 import numpy as np
-from scipy.optimize import minimize_scalar
 import matplotlib.pyplot as plt
 
+from downsample import axes_pixel_width, decimate
+from accuracy import sweep_size
+from labor_model import find_turning_point, solve_hours
+
 # ---------- 参数 ----------
 T = 16.0        # 总可支配时间（小时/日或小时/周，单位一致即可）
 M = 10         # 非劳动收入
 alpha = 1     # 闲暇偏好强度，越大越偏好闲暇（可调整观察效果）
 w_min, w_max = 0.1, 10000.0
-n_w = 2000       # 工资网格密度
+n_w = 2000       # 工资网格密度（standard 档位；preview 取二十分之一）
+accuracy = 'exact'  # 精度档位: preview / standard / exact
 
 # ---------- 效用函数 ----------
 def U_of_L(L, w, T=T, M=M, alpha=alpha):
@@ -18,17 +22,24 @@ def U_of_L(L, w, T=T, M=M, alpha=alpha):
     C = M + w * L
     return np.log(C) + alpha * np.log(R)
 
-def best_L_for_w(w):
-    res = minimize_scalar(lambda L: -U_of_L(L, w),
-                          bounds=(0.0, T),
-                          method='bounded',
-                          options={'xatol':1e-10,'maxiter':500})
-    return float(res.x)
+def dU_dL(L, w, total_hours=T, M=M, alpha=alpha):
+    # U_of_L 对 L 的导数，供向量化二分求解
+    return w / (M + w * L) - alpha / (total_hours - L)
+
+def best_L(w):
+    return solve_hours(w, marginal_utility=dU_dL, accuracy=accuracy, total_hours=T)
 
 # ---------- 求解最优劳动供给 ----------
-w_grid = np.linspace(w_min, w_max, n_w)
-L_star = np.array([best_L_for_w(w) for w in w_grid])
+w_grid = np.linspace(w_min, w_max, sweep_size(n_w, accuracy))
+solved = best_L(w_grid)
+L_star = solved['t']
 R_star = T - L_star
+print(f"求解误差上界: {solved['error_bound']:.2e} 小时")
+
+# ---------- 拐点（L 最大点，黄金分割细化） ----------
+turning = find_turning_point(lambda w: best_L(w)['t'], accuracy=accuracy,
+                             W_grid=w_grid, t_grid=L_star, t_tol=solved['error_bound'])
+imax = int(np.argmin(np.abs(w_grid - turning['W'])))
 
 # ---------- 识别后向弯曲区间（L 随 w 下降） ----------
 dL_dw = np.gradient(L_star, w_grid)
@@ -50,10 +61,12 @@ if in_interval:
 print("检测到的后向弯曲区间（近似）:", backward_intervals)
 
 # ---------- 可视化 ----------
+# 抽稀绘图点（保留拐点与折点）
 plt.figure(figsize=(10,5))
-plt.plot(w_grid, L_star, label='Optimal labor L*(w)', color='tab:blue')
-plt.plot(w_grid, R_star, label='Optimal leisure R*(w)', color='tab:orange', linestyle='--')
-plt.axvline(w_grid[np.argmax(L_star)], color='gray', linestyle=':', label='L 最大点对应工资')
+idx = decimate(w_grid, L_star, axes_pixel_width(plt.gca()), keep=[imax], tol=solved['error_bound'])
+plt.plot(w_grid[idx], L_star[idx], label='Optimal labor L*(w)', color='tab:blue')
+plt.plot(w_grid[idx], R_star[idx], label='Optimal leisure R*(w)', color='tab:orange', linestyle='--')
+plt.axvline(turning['W'], color='gray', linestyle=':', label='L 最大点对应工资')
 for (a,b) in backward_intervals:
     plt.axvspan(a, b, color='red', alpha=0.12)
 
@@ -67,6 +80,6 @@ plt.ylim(0, T)
 plt.show()
 
 # ---------- 可选：打印关键点 ----------
-# 找到 L 的最大值及对应工资（拐点近似）
-imax = np.argmax(L_star)
-print(f"L 最大值 ≈ {L_star[imax]:.4f} 小时，对应工资 w ≈ {w_grid[imax]:.4f}")
+# L 的最大值及对应工资（拐点）
+print(f"L 最大值 ≈ {turning['t']:.4f} 小时，对应工资 w ≈ {turning['W']:.4f} "
+      f"(误差上界 {turning['error_bound']:.1e}，{'内部拐点' if turning['interior'] else '位于区间端点'})")
@@ -17,6 +17,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import minimize_scalar
 
+from accuracy import bounded_error_bound, bounded_options, sweep_size
+from downsample import axes_pixel_width, decimate, gradient_tol
+
 # Set Chinese font
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'Arial']
 plt.rcParams['axes.unicode_minus'] = False
@@ -30,14 +33,15 @@ def utility(t, W, base_income):
     return -U  # Negative for minimization
 
 
-def find_optimal_t(W, base_income):
-    """Find optimal work hours for given wage"""
+def find_optimal_t(W, base_income, accuracy='standard'):
+    """Find optimal work hours for given wage (returns t and its error bound)"""
     result = minimize_scalar(
         lambda t: utility(t, W, base_income),
         bounds=(0, 16),
-        method='bounded'
+        method='bounded',
+        options=bounded_options(accuracy)
     )
-    return result.x
+    return {'t': result.x, 'error_bound': bounded_error_bound(result.x, accuracy)}
 
 
 def analytical_optimal_t(W, base_income):
@@ -49,12 +53,13 @@ def analytical_optimal_t(W, base_income):
     return 8 - base_income / (2 * W)
 
 
-def generate_supply_curves_comparison():
+def generate_supply_curves_comparison(accuracy='standard'):
     """
     Generate multiple supply curves with different base incomes
     to demonstrate forward vs backward-bending behavior
+    (accuracy: 'preview', 'standard' or 'exact'; also sets the number of wages)
     """
-    W_values = np.linspace(10, 1000, 200)
+    W_values = np.linspace(10, 1000, sweep_size(200, accuracy))
     
     # Different scenarios
     scenarios = [
@@ -67,12 +72,13 @@ def generate_supply_curves_comparison():
     results = []
     for scenario in scenarios:
         base_income = scenario['base_income']
-        t_values = [find_optimal_t(W, base_income) for W in W_values]
+        solved = [find_optimal_t(W, base_income, accuracy) for W in W_values]
         t_analytical = [analytical_optimal_t(W, base_income) for W in W_values]
         
         results.append({
             'W': W_values,
-            't_numerical': np.array(t_values),
+            't_numerical': np.array([s['t'] for s in solved]),
+            'error_bound': np.array([s['error_bound'] for s in solved]),
             't_analytical': np.array(t_analytical),
             'base_income': base_income,
             'label': scenario['label'],
@@ -82,37 +88,47 @@ def generate_supply_curves_comparison():
     return results
 
 
-def demonstrate_backward_bending():
+def demonstrate_backward_bending(accuracy='standard'):
     """
     Create a scenario that clearly shows backward-bending
     by using HIGH base income in HIGH wage range
+
+    Returns (wages, work hours, error bounds on the hours)
     """
     # For backward bending, we need high base income
     # Let's use a piecewise base income that increases with wealth
     
-    W_low = np.linspace(10, 200, 50)
-    W_high = np.linspace(200, 1000, 100)
+    W_low = np.linspace(10, 200, sweep_size(50, accuracy))
+    W_high = np.linspace(200, 1000, sweep_size(100, accuracy))
     
     # Scenario 1: Constant high base income
     base_income_high = 3000
-    t_low = [find_optimal_t(W, 100) for W in W_low]  # Start with low base
-    t_high = [find_optimal_t(W, base_income_high) for W in W_high]  # High base for rich
+    low = [find_optimal_t(W, 100, accuracy) for W in W_low]  # Start with low base
+    high = [find_optimal_t(W, base_income_high, accuracy) for W in W_high]  # High base for rich
+    solved = low + high
     
     W_combined = np.concatenate([W_low, W_high])
-    t_combined = np.concatenate([t_low, t_high])
+    t_combined = np.array([s['t'] for s in solved])
+    error_bounds = np.array([s['error_bound'] for s in solved])
     
-    return W_combined, t_combined
+    return W_combined, t_combined, error_bounds
 
 
-def plot_comparison(results, save_path='supply_curve_comparison.png'):
-    """Plot multiple supply curves with different base incomes"""
+def plot_comparison(results, save_path='supply_curve_comparison.png', max_points=None):
+    """
+    Plot multiple supply curves with different base incomes
+    (decimated to max_points per curve, default one per pixel of axes width)
+    """
     
     fig, axes = plt.subplots(1, 2, figsize=(16, 6))
     
     # Left plot: All curves together
     ax1 = axes[0]
     for result in results:
-        ax1.plot(result['t_numerical'], result['W'], 
+        tol = result['error_bound'].max()
+        idx = decimate(result['W'], result['t_numerical'],
+                       max_points or axes_pixel_width(ax1), tol=tol)
+        ax1.plot(result['t_numerical'][idx], result['W'][idx], 
                 linewidth=2.5, label=result['label'], color=result['color'])
     
     ax1.set_xlabel('Work Hours (t)', fontsize=13, fontweight='bold')
@@ -139,7 +155,9 @@ def plot_comparison(results, save_path='supply_curve_comparison.png'):
         t = result['t_numerical']
         # Calculate discrete derivative
         dt_dW = np.gradient(t, W)
-        ax2.plot(W, dt_dW, linewidth=2.5, 
+        idx = decimate(W, dt_dW, max_points or axes_pixel_width(ax2),
+                       tol=gradient_tol(W, result['error_bound'].max()))
+        ax2.plot(W[idx], dt_dW[idx], linewidth=2.5, 
                 label=result['label'], color=result['color'])
     
     ax2.axhline(y=0, color='black', linestyle='--', linewidth=1, alpha=0.5)
@@ -230,7 +248,7 @@ def main():
     
     # Generate comparison curves
     print("\nGenerating supply curves with different base incomes...")
-    results = generate_supply_curves_comparison()
+    results = generate_supply_curves_comparison(accuracy='standard')
     
     # Show key statistics
     print("\nKey Statistics:")
@@ -246,6 +264,7 @@ def main():
         print(f"  Change in hours:      {t_values[-1] - t_values[0]:.4f}")
         print(f"  Max work hours:       {t_values.max():.4f}")
         print(f"  Min work hours:       {t_values.min():.4f}")
+        print(f"  Max error bound on t: {result['error_bound'].max():.2e}")
     
     # Plot comparison
     print("\n" + "-"*70)
@@ -0,0 +1,250 @@
+"""
+Preference Calibration Against Observed Hours
+==============================================
+Estimates the Cobb-Douglas parameters (α, β, base_income) from observed
+(wage, hours) microdata instead of hand-tweaking the scenario lists.
+
+Identification:
+  t* = α/(α+β) × 16 - β/(α+β) × base_income / W
+depends on α and β only through the share α/(α+β), so we normalize
+α + β = 1 and estimate (α, base_income).
+
+Methods:
+  - 'ls'  : least squares on hours, Σ (t_obs - t*(W))²
+  - 'mle' : Tobit maximum likelihood, t_obs = clip(t_latent + ε, 0, 16)
+            with ε ~ N(0, σ²), so zero-hours observations are handled
+            as censored rather than as exact fits
+
+Predicted hours for all observations come from one vectorized call per
+parameter vector. Multi-start optimization runs the starts across a
+process pool; each worker receives the data once at start-up.
+
+Accuracy tiers set the Nelder-Mead tolerances: xatol on the unconstrained
+parameters, fatol per observation (the objectives are sums over
+observations). The iteration cap is at least NELDER_MEAD_MIN_ITER per
+parameter, independent of the scalar-solver maxiter of the tier.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.optimize import minimize
+from scipy.special import log_ndtr
+
+from accuracy import get_tier
+from labor_model import TOTAL_HOURS, optimal_hours
+
+_DATA = {}
+
+NELDER_MEAD_MIN_ITER = 200
+
+
+def unpack_params(theta):
+    """
+    Map unconstrained optimizer variables to model parameters
+
+    theta = [logit(α), log(base_income), log(σ)]   (σ only for 'mle')
+
+    Returns:
+    --------
+    dict : alpha, beta, base_income and (optionally) sigma
+    """
+    alpha = 1.0 / (1.0 + np.exp(-theta[0]))
+    params = {
+        'alpha': alpha,
+        'beta': 1.0 - alpha,
+        'base_income': np.exp(theta[1]),
+    }
+    if len(theta) > 2:
+        params['sigma'] = np.exp(theta[2])
+    return params
+
+
+def latent_hours(W, alpha, beta, base_income, total_hours=TOTAL_HOURS):
+    """Unclipped first-order-condition hours (the Tobit latent variable)"""
+    share = alpha / (alpha + beta)
+    return share * total_hours - (1 - share) * base_income / np.asarray(W, dtype=float)
+
+
+def sse_objective(theta, W, t_obs):
+    """Sum of squared hour residuals"""
+    p = unpack_params(theta)
+    t_hat = optimal_hours(W, p['base_income'], p['alpha'], p['beta'])
+    return float(np.sum((t_obs - t_hat) ** 2))
+
+
+def tobit_neg_loglik(theta, W, t_obs, total_hours=TOTAL_HOURS):
+    """Negative log-likelihood with censoring at 0 and total_hours"""
+    p = unpack_params(theta)
+    sigma = p['sigma']
+    z = (t_obs - latent_hours(W, p['alpha'], p['beta'], p['base_income'], total_hours)) / sigma
+    low = t_obs <= 0
+    high = t_obs >= total_hours
+    ll = np.where(low, log_ndtr(z),
+                  np.where(high, log_ndtr(-z),
+                           -0.5 * z * z - 0.5 * np.log(2 * np.pi) - np.log(sigma)))
+    return float(-np.sum(ll))
+
+
+OBJECTIVES = {
+    'ls': sse_objective,
+    'mle': tobit_neg_loglik,
+}
+
+
+def _init_worker(W, t_obs):
+    """Store the data once per worker process"""
+    _DATA['W'] = W
+    _DATA['t_obs'] = t_obs
+
+
+def _run_start(args):
+    """Run one local optimization from a starting point"""
+    method, theta0, options = args
+    result = minimize(OBJECTIVES[method], theta0, args=(_DATA['W'], _DATA['t_obs']),
+                      method='Nelder-Mead', options=options)
+    best = unpack_params(result.x)
+    vertices = [unpack_params(vertex) for vertex in result.final_simplex[0]]
+    return {
+        'theta': result.x,
+        'objective': float(result.fun),
+        'success': bool(result.success),
+        'nfev': int(result.nfev),
+        'error_bound': {key: float(max(abs(v[key] - best[key]) for v in vertices))
+                        for key in best},
+    }
+
+
+def starting_points(W, t_obs, method='ls', n_starts=8, seed=0):
+    """
+    Random starting points spread over plausible parameter ranges
+
+    Returns:
+    --------
+    array : Shape (n_starts, 2) for 'ls' or (n_starts, 3) for 'mle'
+    """
+    rng = np.random.default_rng(seed)
+    alpha0 = rng.uniform(0.05, 0.95, n_starts)
+    income0 = np.median(W) * rng.uniform(0.1, 10.0, n_starts)
+    theta = [np.log(alpha0 / (1 - alpha0)), np.log(income0)]
+    if method == 'mle':
+        theta.append(np.full(n_starts, np.log(max(np.std(t_obs), 1e-3))))
+    return np.column_stack(theta)
+
+
+def calibrate(W, t_obs, method='ls', n_starts=8, n_workers=None, seed=0,
+              accuracy='standard', options=None):
+    """
+    Estimate preference parameters from observed (wage, hours) pairs
+
+    Parameters:
+    -----------
+    W : array
+        Observed wage rates
+    t_obs : array
+        Observed work hours
+    method : str
+        'ls' (least squares) or 'mle' (Tobit maximum likelihood)
+    n_starts : int
+        Number of random starting points
+    n_workers : int, optional
+        Process pool size; 1 runs the starts in this process
+    seed : int
+        Seed for the starting points
+    accuracy : str or dict
+        Accuracy tier for the Nelder-Mead tolerances
+    options : dict, optional
+        Nelder-Mead options, overriding the accuracy tier
+
+    Returns:
+    --------
+    dict : Best-fit alpha, beta, base_income (and sigma for 'mle'),
+           its objective value, success of the best start, error_bound
+           and the result of every start.
+
+           error_bound maps each parameter to the largest distance between
+           the best point and the other vertices of the final Nelder-Mead
+           simplex. It measures optimizer convergence, not statistical
+           uncertainty, and is NaN when the best start did not converge.
+    """
+    if method not in OBJECTIVES:
+        raise ValueError(f"Unknown method '{method}', expected one of {list(OBJECTIVES)}")
+
+    W = np.asarray(W, dtype=float)
+    t_obs = np.asarray(t_obs, dtype=float)
+    theta0s = starting_points(W, t_obs, method, n_starts, seed)
+    if options is None:
+        tier = get_tier(accuracy)
+        options = {
+            'xatol': tier['xatol'],
+            'fatol': tier['fatol'] * len(W),
+            'maxiter': max(tier['maxiter'], NELDER_MEAD_MIN_ITER * theta0s.shape[1]),
+        }
+    tasks = [(method, theta0, options) for theta0 in theta0s]
+
+    if n_workers == 1:
+        _init_worker(W, t_obs)
+        starts = [_run_start(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(W, t_obs)) as pool:
+            starts = list(pool.map(_run_start, tasks))
+
+    best = min(starts, key=lambda s: s['objective'])
+    result = unpack_params(best['theta'])
+    error_bound = best['error_bound']
+    if not best['success']:
+        print(f"Warning: best calibration start did not converge ({best['nfev']} evaluations)")
+        error_bound = {key: np.nan for key in error_bound}
+    result.update({
+        'method': method,
+        'objective': best['objective'],
+        'success': best['success'],
+        'error_bound': error_bound,
+        'n_obs': len(W),
+        'starts': starts,
+    })
+    return result
+
+
+def simulate_hours(W, alpha=0.3, beta=0.7, base_income=100, sigma=0.5, seed=0):
+    """Synthetic observed hours from the Tobit model (for testing calibration)"""
+    rng = np.random.default_rng(seed)
+    t = latent_hours(W, alpha, beta, base_income) + sigma * rng.standard_normal(np.shape(W))
+    return np.clip(t, 0.0, TOTAL_HOURS)
+
+
+def main():
+    print("=" * 70)
+    print("PREFERENCE CALIBRATION: U = I^α × H^β")
+    print("=" * 70)
+
+    n_obs = 1_000_000
+    rng = np.random.default_rng(42)
+    W = rng.lognormal(mean=np.log(60), sigma=0.8, size=n_obs)
+    true = {'alpha': 0.35, 'beta': 0.65, 'base_income': 150, 'sigma': 0.8}
+    t_obs = simulate_hours(W, **true, seed=1)
+
+    print(f"\nObservations: {n_obs}")
+    print(f"Share at zero hours: {np.mean(t_obs == 0):.1%}")
+    print(f"True parameters: α={true['alpha']}, β={true['beta']}, "
+          f"base_income={true['base_income']}, σ={true['sigma']}")
+
+    print("\n" + "-" * 70)
+    print(f"{'Method':<8} {'α':<10} {'β':<10} {'base_income':<14} {'σ':<10} {'Time (s)':<10}")
+    print("-" * 70)
+    for method in ['ls', 'mle']:
+        start = time.perf_counter()
+        fit = calibrate(W, t_obs, method=method, n_starts=8)
+        elapsed = time.perf_counter() - start
+        sigma = f"{fit['sigma']:.4f}" if 'sigma' in fit else '-'
+        print(f"{method:<8} {fit['alpha']:<10.4f} {fit['beta']:<10.4f} "
+              f"{fit['base_income']:<14.2f} {sigma:<10} {elapsed:<10.2f}")
+    print("-" * 70)
+    print("\nNote: least squares ignores censoring at 0 hours and is biased;")
+    print("the Tobit MLE recovers the true parameters.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+Shape-Preserving Downsampling for Plots and Exports
+====================================================
+Solver output can be far denser than any screen: a 10⁵-point sweep drawn
+into a 10-inch figure or sent to the ECharts front end wastes render time
+and payload. This module picks a bounded subset of point indices:
+
+  - 'lttb'   : Largest-Triangle-Three-Buckets, keeps the points that
+               contribute most to the visual shape
+  - 'minmax' : min and max of y in each x (pixel) bucket, so no spike
+               or dip is lost
+
+Turning points (local extrema of y) and kinks (jumps in slope, e.g. from
+a kinked budget) are detected and always kept exactly, together with any
+indices the caller passes in `keep`.
+
+All functions return sorted index arrays, so every array of the same
+sweep (W, t, I, H, ...) can be indexed consistently.
+
+The plot_* functions default to one point per pixel of axes width
+(axes_pixel_width) and pass the solver's error bound as `tol`. Sweeps
+already sparser than the pixel budget are drawn unchanged, so the
+savings only appear for dense (adaptive or population) sweeps.
+"""
+
+import json
+
+import numpy as np
+
+DEFAULT_MAX_POINTS = 2000
+
+
+def axes_pixel_width(ax):
+    """Width of a matplotlib axes in pixels, the point budget for one line in it"""
+    return max(int(ax.get_window_extent().width), 3)
+
+
+def gradient_tol(x, tol):
+    """Noise level of np.gradient(y, x) when y is accurate to within tol"""
+    dx = np.diff(np.asarray(x, dtype=float))
+    return 2 * tol / np.min(dx[dx > 0]) if tol > 0 else 0.0
+
+
+def feature_indices(x, y, tol=0.0, kink_ratio=10.0):
+    """
+    Indices of turning points and kinks in a sampled curve y(x)
+
+    Parameters:
+    -----------
+    x, y : array
+        Curve samples, x sorted ascending
+    tol : float
+        Noise level of y (e.g. the solver's error_bound); wiggles below
+        it are not reported as turning points or kinks
+    kink_ratio : float
+        A point is a kink when its change in slope exceeds kink_ratio
+        times the change two samples away on either side
+
+    Returns:
+    --------
+    array : Sorted unique indices, including both end points
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= 2:
+        return np.arange(n)
+
+    # Turning points: the direction of y changes (incl. leaving a flat corner);
+    # steps within tol keep the previous direction
+    dy = np.diff(y)
+    direction = np.sign(np.where(np.abs(dy) > tol, dy, 0.0))
+    if tol > 0:
+        fill = np.maximum.accumulate(np.where(direction != 0, np.arange(len(dy)), -1))
+        direction = np.where(fill >= 0, direction[np.maximum(fill, 0)], 0.0)
+    turning = np.flatnonzero(direction[:-1] != direction[1:]) + 1
+
+    # Kinks: a spike in |Δ slope| relative to its surroundings
+    dx = np.diff(x)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where(dx > 0, np.diff(y) / dx, 0.0)
+    ds = np.abs(np.diff(slope))
+    padded = np.pad(ds, 2, mode='edge')
+    baseline = 0.5 * (padded[:-4] + padded[4:])
+    scale = np.finfo(float).eps * max(np.max(np.abs(slope)), 1.0) * 1e3
+    with np.errstate(divide='ignore'):
+        noise = 4 * tol / np.minimum(dx[:-1], dx[1:])
+    kinks = np.flatnonzero((ds > kink_ratio * baseline) & (ds > np.maximum(scale, noise))) + 1
+
+    return np.unique(np.concatenate([[0, n - 1], turning, kinks]))
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling
+
+    Parameters:
+    -----------
+    x, y : array
+        Curve samples, x sorted ascending
+    n_out : int
+        Number of points to keep (>= 3)
+
+    Returns:
+    --------
+    array : Sorted indices of the kept points
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    prev = 0
+    for k in range(n_out - 2):
+        lo, hi = edges[k], edges[k + 1]
+        nxt_lo, nxt_hi = hi, edges[k + 2] if k + 2 < len(edges) else n
+        x_avg = x[nxt_lo:nxt_hi].mean()
+        y_avg = y[nxt_lo:nxt_hi].mean()
+        # Twice the triangle area (prev, candidate, next-bucket average)
+        area = np.abs((x[prev] - x_avg) * (y[lo:hi] - y[prev])
+                      - (x[prev] - x[lo:hi]) * (y_avg - y[prev]))
+        prev = lo + int(np.argmax(area))
+        selected[k + 1] = prev
+    return selected
+
+
+def minmax_indices(x, y, n_buckets):
+    """
+    Min/max decimation over equal-width x buckets (one bucket per pixel)
+
+    Parameters:
+    -----------
+    x, y : array
+        Curve samples, x sorted ascending
+    n_buckets : int
+        Number of x buckets; at most 2 points are kept per bucket
+
+    Returns:
+    --------
+    array : Sorted indices of the kept points
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+
+    span = x[-1] - x[0]
+    if span > 0:
+        bucket = np.minimum(((x - x[0]) / span * n_buckets).astype(int), n_buckets - 1)
+    else:
+        bucket = np.arange(n) * n_buckets // n
+
+    order = np.lexsort((y, bucket))
+    starts = np.flatnonzero(np.diff(bucket[order], prepend=-1))
+    ends = np.append(starts[1:], n) - 1
+    return np.unique(np.concatenate([[0, n - 1], order[starts], order[ends]]))
+
+
+def decimate(x, y, max_points=DEFAULT_MAX_POINTS, method='lttb', keep=None, tol=0.0):
+    """
+    Choose at most about 2 × max_points indices that preserve the curve shape
+
+    Detected features beyond max_points (noisy input) are thinned to the
+    max_points with the largest change in slope, so the output stays bounded.
+
+    Parameters:
+    -----------
+    x, y : array
+        Curve samples, x sorted ascending (e.g. W and t of a sweep)
+    max_points : int
+        Target number of points, excluding detected features
+    method : str
+        'lttb' or 'minmax'
+    keep : array of int, optional
+        Extra indices that must be kept (turning points, kinks, ...)
+    tol : float
+        Noise level of y for feature detection
+
+    Returns:
+    --------
+    array : Sorted unique indices into x and y
+    """
+    n = len(x)
+    if n <= max_points:
+        return np.arange(n)
+
+    if method == 'lttb':
+        selected = lttb_indices(x, y, max_points)
+    elif method == 'minmax':
+        selected = minmax_indices(x, y, max(max_points // 2, 1))
+    else:
+        raise ValueError(f"Unknown method '{method}', expected 'lttb' or 'minmax'")
+
+    features = feature_indices(x, y, tol)
+    if len(features) > max_points:
+        x_arr = np.asarray(x, dtype=float)
+        y_arr = np.asarray(y, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = np.diff(y_arr) / np.diff(x_arr)
+        jump = np.abs(np.diff(np.nan_to_num(slope), prepend=0, append=0))
+        features = np.sort(features[np.argsort(-jump[features])[:max_points]])
+    extra = [features]
+    if keep is not None:
+        extra.append(np.asarray(keep, dtype=int))
+    return np.unique(np.concatenate([selected] + extra))
+
+
+def export_series_json(path, x, y, max_points=DEFAULT_MAX_POINTS, method='lttb',
+                       keep=None, tol=0.0, swap_axes=False):
+    """
+    Write a decimated curve as an ECharts line series data array
+
+    Parameters:
+    -----------
+    path : str
+        Output JSON file
+    x, y : array
+        Curve samples, x sorted ascending
+    max_points, method, keep, tol :
+        As in decimate
+    swap_axes : bool
+        Emit [y, x] pairs, e.g. to draw hours on the x axis and wage on y
+
+    Returns:
+    --------
+    int : Number of points written
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    idx = decimate(x, y, max_points, method, keep, tol)
+    pairs = np.column_stack([y[idx], x[idx]] if swap_axes else [x[idx], y[idx]])
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(pairs.tolist(), f)
+    return len(idx)
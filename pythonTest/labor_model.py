@@ -0,0 +1,262 @@
+"""
+Cobb-Douglas Labor Supply Model (Vectorized)
+=============================================
+Utility Function: U = I^α × H^β
+where:
+  I = base_income + W * t  (Income)
+  H = 16 - t               (Leisure hours)
+  t = work hours, range [0, 16]
+
+Closed-form optimum (interior):
+  t* = α/(α+β) × 16 - β/(α+β) × base_income / W
+clipped to [0, 16].
+
+Special cases used by the other scripts:
+  - U = I × H                 → α = 1, β = 1
+  - U = ln C + alpha × ln R   → α = 1, β = alpha  (back2.py)
+
+Every function accepts scalars or numpy arrays for W, so a whole
+wage grid is solved in one call instead of one minimize_scalar per point.
+The numeric solver and turning-point search take an accuracy tier
+(see accuracy.py) and report the error bound they achieved.
+"""
+
+import numpy as np
+
+from accuracy import get_tier, sweep_size
+
+TOTAL_HOURS = 16.0
+
+
+def utility_cd(t, W, base_income=100, alpha=0.3, beta=0.7, total_hours=TOTAL_HOURS):
+    """
+    Calculate utility U = I^α × H^β (vectorized)
+
+    Parameters:
+    -----------
+    t : float or array
+        Work hours (0 to total_hours)
+    W : float or array
+        Wage rate
+    base_income : float
+        Base (unearned) income
+    alpha, beta : float
+        Preference weights on income and leisure
+    total_hours : float
+        Time endowment
+
+    Returns:
+    --------
+    array : Utility value (-inf where I <= 0 or H <= 0)
+    """
+    t = np.asarray(t, dtype=float)
+    I = base_income + np.asarray(W, dtype=float) * t
+    H = total_hours - t
+    return utility_from_bundle(I, H, alpha, beta)
+
+
+def utility_from_bundle(I, H, alpha=0.3, beta=0.7):
+    """
+    Calculate utility U = I^α × H^β directly from income and leisure,
+    for budgets that are not of the form base_income + W * t
+
+    Returns:
+    --------
+    array : Utility value (-inf where I <= 0 or H <= 0)
+    """
+    I = np.asarray(I, dtype=float)
+    H = np.asarray(H, dtype=float)
+    valid = (I > 0) & (H > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        U = np.where(valid, np.abs(I) ** alpha * np.abs(H) ** beta, -np.inf)
+    return U
+
+
+def optimal_hours(W, base_income=100, alpha=0.3, beta=0.7, total_hours=TOTAL_HOURS):
+    """
+    Optimal work hours t*(W) from the closed-form first-order condition
+
+    Parameters:
+    -----------
+    W : float or array
+        Wage rate (must be positive)
+    base_income : float
+        Base (unearned) income
+    alpha, beta : float
+        Preference weights on income and leisure
+    total_hours : float
+        Time endowment
+
+    Returns:
+    --------
+    array : Optimal work hours, same shape as W
+    """
+    W = np.asarray(W, dtype=float)
+    share = alpha / (alpha + beta)
+    t_interior = share * total_hours - (1 - share) * base_income / W
+    return np.clip(t_interior, 0.0, total_hours)
+
+
+def generate_supply_curve(W_values, base_income=100, alpha=0.3, beta=0.7,
+                          total_hours=TOTAL_HOURS):
+    """
+    Generate labor supply curve data points in one vectorized call
+
+    Returns:
+    --------
+    dict : Contains W, t, I, H and U arrays
+    """
+    W = np.asarray(W_values, dtype=float)
+    t = optimal_hours(W, base_income, alpha, beta, total_hours)
+    return {
+        'W': W,
+        't': t,
+        'I': base_income + W * t,
+        'H': total_hours - t,
+        'U': utility_cd(t, W, base_income, alpha, beta, total_hours),
+    }
+
+
+def marginal_utility_cd(t, W, base_income=100, alpha=0.3, beta=0.7, total_hours=TOTAL_HOURS):
+    """
+    dU/dt of the log utility α ln I + β ln H (same maximizer as I^α × H^β)
+
+    Returns:
+    --------
+    array : α W / I - β / H
+    """
+    t = np.asarray(t, dtype=float)
+    W = np.asarray(W, dtype=float)
+    return alpha * W / (base_income + W * t) - beta / (total_hours - t)
+
+
+def solve_hours(W, marginal_utility=None, accuracy='standard', total_hours=TOTAL_HOURS,
+                **params):
+    """
+    Optimal work hours by vectorized bisection on the first-order condition
+
+    Works for any utility that is concave in t; all wages are bisected
+    together, so the cost is one array operation per iteration.
+
+    Parameters:
+    -----------
+    W : float or array
+        Wage rate
+    marginal_utility : callable, optional
+        f(t, W, **params) returning dU/dt; defaults to marginal_utility_cd
+    accuracy : str or dict
+        Accuracy tier; sets the bracket width target xatol
+    total_hours : float
+        Time endowment
+    **params :
+        Passed to marginal_utility (base_income, alpha, beta, ...)
+
+    Returns:
+    --------
+    dict : Contains optimal t, its error_bound (final bracket half-width)
+           and the number of iterations
+    """
+    tier = get_tier(accuracy)
+    if marginal_utility is None:
+        marginal_utility = marginal_utility_cd
+    W = np.asarray(W, dtype=float)
+
+    lo = np.zeros_like(W)
+    hi = np.full_like(W, total_hours)
+    n_iter = int(np.ceil(np.log2(total_hours / tier['xatol'])))
+    n_iter = min(max(n_iter, 1), tier['maxiter'])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(n_iter):
+            mid = 0.5 * (lo + hi)
+            rising = marginal_utility(mid, W, total_hours=total_hours, **params) > 0
+            lo = np.where(rising, mid, lo)
+            hi = np.where(rising, hi, mid)
+
+    return {
+        't': 0.5 * (lo + hi),
+        'error_bound': total_hours / 2 ** (n_iter + 1),
+        'iterations': n_iter,
+    }
+
+
+def find_turning_point(hours_fn, W_min=None, W_max=None, accuracy='standard',
+                       W_grid=None, t_grid=None, t_tol=None):
+    """
+    Wage at which labor supply peaks (start of backward bending)
+
+    A coarse grid of wages brackets the maximum of t(W); a golden-section
+    search then narrows the bracket to xatol. Near a smooth maximum
+    t(W) ≈ t* - k (W - W*)², so hours accurate to t_tol only pin W down to
+    about sqrt(2 t_tol / k); the search stops once the two probes differ by
+    less than 2 t_tol, and the bound includes that term (k is estimated
+    from the bracketing grid points) plus a sqrt(eps) × |W| floor.
+
+    Parameters:
+    -----------
+    hours_fn : callable
+        Vectorized f(W) returning optimal hours
+    W_min, W_max : float
+        Wage range to search (ignored when W_grid is given)
+    accuracy : str or dict
+        Accuracy tier
+    W_grid, t_grid : array, optional
+        An existing sweep to use as the coarse grid instead of new
+        evaluations; t_grid is computed from W_grid if omitted
+    t_tol : float or array, optional
+        Error bound of the hours from hours_fn (e.g. solve_hours or
+        bounded_error_bound); 0 for closed-form hours. If omitted the
+        error bound is NaN
+
+    Returns:
+    --------
+    dict : W and t at the peak, whether it is interior (a real turning
+           point rather than an end of the range) and error_bound on W
+    """
+    tier = get_tier(accuracy)
+    if W_grid is None:
+        W_grid = np.linspace(W_min, W_max, sweep_size(accuracy=accuracy))
+    W_grid = np.asarray(W_grid, dtype=float)
+    if t_grid is None:
+        t_grid = hours_fn(W_grid)
+    t_grid = np.asarray(t_grid, dtype=float)
+    noise = np.nan if t_tol is None else float(np.max(t_tol))
+    i = int(np.argmax(t_grid))
+    if i == 0 or i == len(W_grid) - 1:
+        return {'W': W_grid[i], 't': t_grid[i], 'interior': False,
+                'error_bound': np.nan if t_tol is None else 0.0}
+
+    a, b = W_grid[i - 1], W_grid[i + 1]
+    # Curvature k from the parabola through the three bracketing grid points
+    W0, W1, W2 = W_grid[i - 1:i + 2]
+    t0, t1, t2 = t_grid[i - 1:i + 2]
+    k = -((t2 - t1) / (W2 - W1) - (t1 - t0) / (W1 - W0)) / (W2 - W0)
+
+    ratio = (np.sqrt(5) - 1) / 2
+    c, d = b - ratio * (b - a), a + ratio * (b - a)
+    tc, td = hours_fn(np.array([c, d]))
+    sqrt_eps = np.sqrt(np.finfo(float).eps)
+    for _ in range(tier['maxiter']):
+        if b - a <= 2 * (tier['xatol'] + sqrt_eps * abs(a + b) / 2):
+            break
+        if abs(tc - td) <= 2 * noise:
+            break  # Probes no longer distinguishable through the hours noise
+        if tc >= td:
+            b, d, td = d, c, tc
+            c = b - ratio * (b - a)
+            tc = float(hours_fn(np.array([c]))[0])
+        else:
+            a, c, tc = c, d, td
+            d = a + ratio * (b - a)
+            td = float(hours_fn(np.array([d]))[0])
+
+    W_peak = 0.5 * (a + b)
+    if noise > 0:
+        flat = np.sqrt(2 * noise / k) if k > 0 else 0.5 * (W2 - W0)
+    else:
+        flat = 0.0 if noise == 0 else np.nan
+    return {
+        'W': W_peak,
+        't': float(hours_fn(np.array([W_peak]))[0]),
+        'interior': True,
+        'error_bound': float(np.maximum(0.5 * (b - a), flat)) + sqrt_eps * abs(W_peak),
+    }
@@ -16,6 +16,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import minimize_scalar
 
+from accuracy import bounded_error_bound, bounded_options, sweep_size
+from downsample import axes_pixel_width, decimate
+
 # Set Chinese font for matplotlib (optional, for better display)
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'Arial']
 plt.rcParams['axes.unicode_minus'] = False
@@ -43,7 +46,7 @@ def utility(t, W, base_income=100):
     return -U  # Negative because we minimize (to maximize U)
 
 
-def find_optimal_t(W, base_income=100):
+def find_optimal_t(W, base_income=100, accuracy='standard'):
     """
     Find the optimal work hours t that maximizes utility for given wage W
     
@@ -53,16 +56,19 @@ def find_optimal_t(W, base_income=100):
         Wage rate
     base_income : float
         Base income
+    accuracy : str
+        Accuracy tier: 'preview', 'standard' or 'exact'
         
     Returns:
     --------
-    dict : Contains optimal t, utility value, and optimization result
+    dict : Contains optimal t, utility value, error bound on t, and optimization result
     """
     # Use scipy's minimize_scalar for bounded optimization
     result = minimize_scalar(
         lambda t: utility(t, W, base_income),
         bounds=(0, 16),
-        method='bounded'
+        method='bounded',
+        options=bounded_options(accuracy)
     )
     
     optimal_t = result.x
@@ -73,11 +79,12 @@ def find_optimal_t(W, base_income=100):
         'U': optimal_U,
         'I': base_income + W * optimal_t,
         'H': 16 - optimal_t,
+        'error_bound': bounded_error_bound(optimal_t, accuracy),
         'success': result.success
     }
 
 
-def generate_supply_curve(W_min=10, W_max=1000, W_step=5, base_income=100):
+def generate_supply_curve(W_min=10, W_max=1000, W_step=5, base_income=100, accuracy='standard'):
     """
     Generate labor supply curve data points
     
@@ -88,32 +95,39 @@ def generate_supply_curve(W_min=10, W_max=1000, W_step=5, base_income=100):
     W_max : float
         Maximum wage rate
     W_step : float
-        Step size for wage rate
+        Step size for wage rate at the standard tier (preview solves
+        one wage in twenty, see accuracy.sweep_size)
     base_income : float
         Base income
+    accuracy : str
+        Accuracy tier: 'preview', 'standard' or 'exact'
         
     Returns:
     --------
-    tuple : (wage_values, work_hours, utilities)
+    tuple : (wage_values, work_hours, utilities, error_bounds)
     """
-    W_values = np.arange(W_min, W_max + W_step, W_step)
+    n_points = int(round((W_max - W_min) / W_step)) + 1
+    W_values = np.linspace(W_min, W_max, sweep_size(n_points, accuracy))
     t_values = []
     U_values = []
+    error_bounds = []
     
     for W in W_values:
-        result = find_optimal_t(W, base_income)
+        result = find_optimal_t(W, base_income, accuracy)
         if result['success']:
             t_values.append(result['t'])
             U_values.append(result['U'])
+            error_bounds.append(result['error_bound'])
         else:
             print(f"Warning: Optimization failed for W={W}")
             t_values.append(np.nan)
             U_values.append(np.nan)
+            error_bounds.append(np.nan)
     
-    return W_values, np.array(t_values), np.array(U_values)
+    return W_values, np.array(t_values), np.array(U_values), np.array(error_bounds)
 
 
-def plot_supply_curve(W_values, t_values, save_path=None):
+def plot_supply_curve(W_values, t_values, save_path=None, max_points=None, tol=0.0):
     """
     Plot the labor supply curve
     
@@ -125,12 +139,18 @@ def plot_supply_curve(W_values, t_values, save_path=None):
         Optimal work hours for each wage
     save_path : str, optional
         Path to save the figure
+    max_points : int, optional
+        Decimate the curve to about this many points (turning points kept);
+        defaults to the axes width in pixels
+    tol : float
+        Error bound of t_values, so solver noise is not kept as features
     """
     fig, ax = plt.subplots(figsize=(10, 6))
     
     # Plot the supply curve
-    ax.plot(t_values, W_values, 'b-', linewidth=2, label='Labor Supply Curve')
-    ax.scatter(t_values[::10], W_values[::10], c='red', s=50, zorder=5, alpha=0.6)
+    idx = decimate(W_values, t_values, max_points or axes_pixel_width(ax), tol=tol)
+    ax.plot(t_values[idx], W_values[idx], 'b-', linewidth=2, label='Labor Supply Curve')
+    ax.scatter(t_values[idx[::10]], W_values[idx[::10]], c='red', s=50, zorder=5, alpha=0.6)
     
     ax.set_xlabel('Work Hours (t)', fontsize=12, fontweight='bold')
     ax.set_ylabel('Wage Rate (W)', fontsize=12, fontweight='bold')
@@ -167,11 +187,12 @@ def main():
     
     # Generate supply curve data
     print("Generating supply curve data...")
-    W_values, t_values, U_values = generate_supply_curve(
+    W_values, t_values, U_values, error_bounds = generate_supply_curve(
         W_min=10, 
         W_max=1000, 
         W_step=5,
-        base_income=100
+        base_income=100,
+        accuracy='standard'
     )
     
     # Display some sample results
@@ -192,10 +213,12 @@ def main():
     print(f"\nTotal data points: {len(W_values)}")
     print(f"Work hours range: [{t_values.min():.4f}, {t_values.max():.4f}]")
     print(f"Utility range: [{U_values.min():.2f}, {U_values.max():.2f}]")
+    print(f"Max error bound on t: {np.nanmax(error_bounds):.2e}")
     
     # Plot the curve
     print("\nPlotting labor supply curve...")
-    plot_supply_curve(W_values, t_values, save_path='labor_supply_curve.png')
+    plot_supply_curve(W_values, t_values, save_path='labor_supply_curve.png',
+                      tol=np.nanmax(error_bounds))
     
     print("\n✓ Analysis complete!")
 
@@ -0,0 +1,127 @@
+"""
+Slutsky Decomposition of Labor Supply
+======================================
+Splits the slope of the labor supply curve dt*/dW into:
+  - Substitution effect: compensated change at fixed utility (> 0)
+  - Income effect: change from the extra full income W raises (< 0
+    when leisure is a normal good)
+
+Cobb-Douglas utility U = I^α × H^β, full income M = base_income + 16W.
+
+Expenditure-minimization dual (Hicksian leisure at utility level u):
+  H^c(W, u) = (β/(αW))^(α/(α+β)) × u^(1/(α+β))
+  ∂H^c/∂W   = -α/(α+β) × H^c / W
+
+Slutsky equation for leisure with an hours endowment:
+  dH/dW = ∂H^c/∂W + t × ∂H/∂M,   ∂H/∂M = β/((α+β)W)
+
+Labor effects are the negatives of the leisure effects. All quantities
+are closed form, so the decomposition of a 10⁵-point grid costs the same
+as the supply curve itself.
+"""
+
+import numpy as np
+
+from labor_model import TOTAL_HOURS, optimal_hours, utility_cd
+
+
+def hicksian_leisure(W, u, alpha=0.3, beta=0.7):
+    """
+    Compensated leisure demand H^c(W, u) from expenditure minimization
+
+    Parameters:
+    -----------
+    W : float or array
+        Wage rate (price of leisure)
+    u : float or array
+        Target utility level
+    alpha, beta : float
+        Preference weights on income and leisure
+
+    Returns:
+    --------
+    array : Leisure hours that reach u at minimum expenditure
+    """
+    W = np.asarray(W, dtype=float)
+    u = np.asarray(u, dtype=float)
+    return (beta / (alpha * W)) ** (alpha / (alpha + beta)) * u ** (1 / (alpha + beta))
+
+
+def slutsky_decomposition(W_values, base_income=100, alpha=0.3, beta=0.7,
+                          total_hours=TOTAL_HOURS):
+    """
+    Decompose dt*/dW into substitution and income effects for every wage
+
+    Parameters:
+    -----------
+    W_values : array
+        Wage rates
+    base_income : float
+        Base (unearned) income
+    alpha, beta : float
+        Preference weights on income and leisure
+    total_hours : float
+        Time endowment
+
+    Returns:
+    --------
+    dict : W, t, total, substitution and income arrays (effects on work
+           hours per unit of wage; total = substitution + income).
+           Corner solutions (t* = 0 or t* = total_hours) get zero effects.
+    """
+    W = np.asarray(W_values, dtype=float)
+    t = optimal_hours(W, base_income, alpha, beta, total_hours)
+    H = total_hours - t
+    interior = (t > 0) & (t < total_hours)
+
+    u = utility_cd(t, W, base_income, alpha, beta, total_hours)
+    with np.errstate(invalid='ignore'):
+        H_c = hicksian_leisure(W, u, alpha, beta)
+    H_c = np.where(interior, H_c, H)
+
+    dHc_dW = -alpha / (alpha + beta) * H_c / W
+    dH_dM = beta / ((alpha + beta) * W)
+
+    substitution = np.where(interior, -dHc_dW, 0.0)
+    income = np.where(interior, -t * dH_dM, 0.0)
+
+    return {
+        'W': W,
+        't': t,
+        'total': substitution + income,
+        'substitution': substitution,
+        'income': income,
+    }
+
+
+def main():
+    print("=" * 70)
+    print("SLUTSKY DECOMPOSITION: U = I^α × H^β")
+    print("=" * 70)
+
+    W_values = np.linspace(10, 10000, 100000)
+    result = slutsky_decomposition(W_values, base_income=100, alpha=0.3, beta=0.7)
+
+    # Compare the analytic total with the numerical slope of t*(W)
+    dt_dW = np.gradient(result['t'], result['W'])
+    interior = (result['t'] > 0) & (result['t'] < TOTAL_HOURS)
+    max_err = np.max(np.abs(dt_dW - result['total'])[interior][1:-1])
+
+    print(f"\nGrid points: {len(W_values)}")
+    print(f"Max |dt/dW (numerical) - (sub + inc)|: {max_err:.3e}")
+
+    print("\n" + "-" * 70)
+    print(f"{'Wage (W)':<12} {'t*':<10} {'Substitution':<15} {'Income':<15} {'Total':<15}")
+    print("-" * 70)
+    for idx in [0, 10, 100, 1000, 10000, -1]:
+        print(f"{result['W'][idx]:<12.2f} {result['t'][idx]:<10.4f} "
+              f"{result['substitution'][idx]:<15.6f} {result['income'][idx]:<15.6f} "
+              f"{result['total'][idx]:<15.6f}")
+    print("-" * 70)
+
+    dominated = np.any(result['income'] + result['substitution'] < 0)
+    print("\nIncome effect dominates somewhere:", "YES" if dominated else "NO")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import minimize_scalar
 
+from accuracy import bounded_error_bound, bounded_options, sweep_size
+from downsample import axes_pixel_width, decimate, gradient_tol
+from labor_model import find_turning_point
+
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'Arial']
 plt.rcParams['axes.unicode_minus'] = False
 
@@ -33,19 +37,26 @@ def utility_cobb_douglas(t, W, base_income=100, alpha=0.3, beta=0.7):
     return -U  # Negative for minimization
 
 
-def find_optimal_t_cd(W, base_income=100, alpha=0.3, beta=0.7):
-    """Find optimal work hours with Cobb-Douglas utility"""
+def find_optimal_t_cd(W, base_income=100, alpha=0.3, beta=0.7, accuracy='standard'):
+    """Find optimal work hours with Cobb-Douglas utility (returns t and its error bound)"""
     result = minimize_scalar(
         lambda t: utility_cobb_douglas(t, W, base_income, alpha, beta),
         bounds=(0, 16),
-        method='bounded'
+        method='bounded',
+        options=bounded_options(accuracy)
     )
-    return result.x
+    return {'t': result.x, 'error_bound': bounded_error_bound(result.x, accuracy)}
+
 
+def generate_backward_bending_curves(accuracy='standard'):
+    """
+    Generate curves with different preference parameters
 
-def generate_backward_bending_curves():
-    """Generate curves with different preference parameters"""
-    W_values = np.linspace(10, 10000, 300)
+    The accuracy tier ('preview', 'standard' or 'exact') sets both the
+    per-point solver tolerance, the number of wages solved and the
+    turning-point search.
+    """
+    W_values = np.linspace(10, 10000, sweep_size(300, accuracy))
     
     scenarios = [
         {'alpha': 0.5, 'beta': 0.5, 'label': 'Equal Preferences (α=0.5, β=0.5)', 'color': 'blue'},
@@ -58,12 +69,21 @@ def generate_backward_bending_curves():
     for scenario in scenarios:
         alpha = scenario['alpha']
         beta = scenario['beta']
-        t_values = [find_optimal_t_cd(W, base_income=100, alpha=alpha, beta=beta) 
-                    for W in W_values]
+        solved = [find_optimal_t_cd(W, base_income=100, alpha=alpha, beta=beta, accuracy=accuracy) 
+                  for W in W_values]
+        t_values = np.array([s['t'] for s in solved])
+        
+        def hours_fn(W_array, alpha=alpha, beta=beta):
+            return np.array([find_optimal_t_cd(W, 100, alpha, beta, accuracy)['t'] for W in W_array])
         
+        error_bounds = np.array([s['error_bound'] for s in solved])
         results.append({
             'W': W_values,
-            't': np.array(t_values),
+            't': t_values,
+            'error_bound': error_bounds,
+            'turning_point': find_turning_point(hours_fn, accuracy=accuracy,
+                                                W_grid=W_values, t_grid=t_values,
+                                                t_tol=error_bounds),
             'alpha': alpha,
             'beta': beta,
             'label': scenario['label'],
@@ -83,25 +103,19 @@ def analyze_backward_bending_points(results):
         W = result['W']
         t = result['t']
         
-        # Calculate slope
-        dt_dW = np.gradient(t, W)
-        
-        # Find where slope becomes negative
-        backward_indices = np.where(dt_dW < 0)[0]
+        # Peak of t(W), refined by golden-section search
+        turning = result['turning_point']
         
         print(f"\n{result['label']}")
         print("-"*80)
         
-        if len(backward_indices) > 0:
-            first_backward_idx = backward_indices[0]
-            W_turning = W[first_backward_idx]
-            t_turning = t[first_backward_idx]
-            
+        if turning['interior']:
             print(f"  ✓ BACKWARD-BENDING observed!")
-            print(f"  Turning point: W ≈ {W_turning:.2f}, t ≈ {t_turning:.4f}")
+            print(f"  Turning point: W ≈ {turning['W']:.2f} (± {turning['error_bound']:.1e}), "
+                  f"t ≈ {turning['t']:.4f}")
             print(f"  Work hours at W=10:   {t[0]:.4f}")
             print(f"  Work hours at W=1000: {t[-1]:.4f}")
-            print(f"  Maximum work hours:   {t.max():.4f} (at W ≈ {W[t.argmax()]:.2f})")
+            print(f"  Maximum work hours:   {turning['t']:.4f} (at W ≈ {turning['W']:.2f})")
             print(f"  Change (low to high): {t[-1] - t[0]:.4f} (NEGATIVE = backward-bending)")
         else:
             print(f"  ✗ No backward-bending (always increasing)")
@@ -109,8 +123,11 @@ def analyze_backward_bending_points(results):
             print(f"  Work hours at W=1000: {t[-1]:.4f}")
 
 
-def plot_backward_bending(results, save_path='backward_bending_curves.png'):
-    """Plot labor supply curves showing backward-bending"""
+def plot_backward_bending(results, save_path='backward_bending_curves.png', max_points=None):
+    """
+    Plot labor supply curves showing backward-bending
+    (decimated to max_points per curve, default one per pixel of axes width)
+    """
     
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     axes = axes.flatten()
@@ -118,7 +135,9 @@ def plot_backward_bending(results, save_path='backward_bending_curves.png'):
     # Plot 1: All curves together
     ax = axes[0]
     for result in results:
-        ax.plot(result['t'], result['W'], 
+        idx = decimate(result['W'], result['t'], max_points or axes_pixel_width(ax),
+                       tol=result['error_bound'].max())
+        ax.plot(result['t'][idx], result['W'][idx], 
                 linewidth=2.5, label=result['label'], color=result['color'])
     
     ax.set_xlabel('Work Hours (t)', fontsize=12, fontweight='bold')
@@ -135,7 +154,9 @@ def plot_backward_bending(results, save_path='backward_bending_curves.png'):
         W = result['W']
         t = result['t']
         dt_dW = np.gradient(t, W)
-        ax.plot(W, dt_dW, linewidth=2.5, 
+        idx = decimate(W, dt_dW, max_points or axes_pixel_width(ax),
+                       tol=gradient_tol(W, result['error_bound'].max()))
+        ax.plot(W[idx], dt_dW[idx], linewidth=2.5, 
                 label=result['label'], color=result['color'])
     
     ax.axhline(y=0, color='black', linestyle='--', linewidth=1.5, alpha=0.7)
@@ -156,14 +177,18 @@ def plot_backward_bending(results, save_path='backward_bending_curves.png'):
     dt_dW = np.gradient(t, W)
     colors = ['green' if slope > 0 else 'red' for slope in dt_dW]
     
-    for i in range(len(W)-1):
-        ax.plot(t[i:i+2], W[i:i+2], color=colors[i], linewidth=3, alpha=0.7)
-    
     # Mark turning point
-    max_idx = t.argmax()
-    ax.scatter([t[max_idx]], [W[max_idx]], s=200, c='gold', 
+    turning = result['turning_point']
+    max_idx = int(np.argmin(np.abs(W - turning['W'])))
+    
+    idx = decimate(W, t, max_points or axes_pixel_width(ax), keep=[max_idx],
+                   tol=result['error_bound'].max())
+    for i, j in zip(idx[:-1], idx[1:]):
+        ax.plot(t[[i, j]], W[[i, j]], color=colors[i], linewidth=3, alpha=0.7)
+    
+    ax.scatter([turning['t']], [turning['W']], s=200, c='gold', 
                edgecolors='black', linewidths=2, zorder=10, 
-               marker='*', label=f'Turning Point (W≈{W[max_idx]:.0f})')
+               marker='*', label=f'Turning Point (W≈{turning["W"]:.0f})')
     
     ax.set_xlabel('Work Hours (t)', fontsize=12, fontweight='bold')
     ax.set_ylabel('Wage Rate (W)', fontsize=12, fontweight='bold')
@@ -187,10 +212,11 @@ def plot_backward_bending(results, save_path='backward_bending_curves.png'):
     t = result['t']
     I = 100 + W * t
     H = 16 - t
+    idx = decimate(W, t, max_points or axes_pixel_width(ax), tol=result['error_bound'].max())
     
-    ax.plot(W, t, 'b-', linewidth=2.5, label='Work Hours (t)')
-    ax.plot(W, H, 'r-', linewidth=2.5, label='Leisure Hours (H)')
-    ax.plot(W, I/100, 'g-', linewidth=2.5, label='Income (I/100)')
+    ax.plot(W[idx], t[idx], 'b-', linewidth=2.5, label='Work Hours (t)')
+    ax.plot(W[idx], H[idx], 'r-', linewidth=2.5, label='Leisure Hours (H)')
+    ax.plot(W[idx], I[idx]/100, 'g-', linewidth=2.5, label='Income (I/100)')
     
     ax.set_xlabel('Wage Rate (W)', fontsize=12, fontweight='bold')
     ax.set_ylabel('Hours / Income (scaled)', fontsize=12, fontweight='bold')
@@ -221,7 +247,7 @@ def main():
     
     # Generate curves
     print("\nGenerating labor supply curves...")
-    results = generate_backward_bending_curves()
+    results = generate_backward_bending_curves(accuracy='standard')
     
     # Analyze backward-bending
     analyze_backward_bending_points(results)